@@ -0,0 +1,33 @@
+"""
+`rio new` derives a Python module name from whatever name the user typed in.
+
+This file ensures that the derived names are valid and stay close to the input.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from rio.cli.project_setup import derive_module_name
+
+
+@pytest.mark.parametrize(
+    "raw_name, expected_module_name",
+    [
+        ("Hello World", "hello_world"),
+        ("my-app 2", "my_app_2"),
+        ("a<b>:c", "abc"),
+        ("café au lait", "café_au_lait"),
+        ("Area²", "area"),
+        ("Half ½ App", "half__app"),
+        ("Project ①", "project_"),
+        ("123abc", "abc"),
+        ("9", "rio_app"),
+        ("", "rio_app"),
+    ],
+)
+def test_derive_module_name(raw_name: str, expected_module_name: str) -> None:
+    module_name = derive_module_name(raw_name)
+
+    assert module_name == expected_module_name
+    assert module_name.isidentifier()